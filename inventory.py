@@ -1,112 +1,340 @@
+import atexit
+import logging
+import os
+import threading
+import uuid
 import streamlit as st
 import pandas as pd
 import numpy as np
-import plotly.express as px
+import plotly.graph_objects as go
 from datetime import datetime, timedelta
 from io import BytesIO
-import base64
-
-# Initialize session state
-if 'inventory' not in st.session_state:
-    st.session_state.inventory = pd.DataFrame({
-        'Product ID': ['P001', 'P002', 'P003'],
-        'Product Name': ['Laptop', 'Mouse', 'Keyboard'],
-        'Category': ['Electronics', 'Accessories', 'Accessories'],
-        'Quantity': [50, 200, 150],
-        'Price': [80000, 500, 1200],
-        'Supplier': ['TechCorp', 'PeriTech', 'KeyMaster'],
-        'Location': ['Warehouse A', 'Warehouse B', 'Warehouse A'],
-        'Reorder Level': [10, 50, 30],
-        'Expiry Date': [None, None, None],
-        'Status': ['Active', 'Active', 'Active']
-    })
-
-if 'transactions' not in st.session_state:
-    st.session_state.transactions = pd.DataFrame({
-        'Transaction ID': ['T001', 'T002'],
-        'Product ID': ['P001', 'P002'],
-        'Product Name': ['Laptop', 'Mouse'],
-        'Quantity': [5, 10],
-        'Transaction Type': ['Sale', 'Purchase'],
-        'Date': [datetime.now() - timedelta(days=1), datetime.now()]
-    })
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+DATA_DIR = os.environ.get('IMS_DATA_DIR', 'data')
+INVENTORY_PATH = os.path.join(DATA_DIR, 'inventory.parquet')
+TRANSACTIONS_PATH = os.path.join(DATA_DIR, 'transactions.parquet')
+
+INVENTORY_COLUMNS = ['Product ID', 'Product Name', 'Category', 'Quantity', 'Price', 'Supplier',
+                     'Location', 'Reorder Level', 'Expiry Date', 'Status']
+TRANSACTION_COLUMNS = ['Transaction ID', 'Product ID', 'Product Name', 'Quantity',
+                       'Transaction Type', 'Date']
+CATEGORIES = ["Electronics", "Accessories", "Furniture", "Stationery", "Other"]
+LOCATIONS = ["Warehouse A", "Warehouse B", "Store Front"]
+MAX_QUANTITY = int(np.iinfo(np.int32).max)
+MAX_REORDER_LEVEL = int(np.iinfo(np.int16).max)
+# Below this size the NumPy mask is already memory-bound-fast and JIT dispatch isn't worth it
+NUMBA_MIN_ROWS = 1_000_000
+
+# Explicit dtypes so frames built from the row buffers skip inference;
+# low-cardinality text columns are stored as categoricals
+INVENTORY_DTYPES = {
+    'Product ID': 'string',
+    'Product Name': 'string',
+    'Category': pd.CategoricalDtype(categories=CATEGORIES),
+    'Quantity': 'int32',
+    'Price': 'float64',
+    'Supplier': 'category',
+    'Location': pd.CategoricalDtype(categories=LOCATIONS),
+    'Reorder Level': 'int16',
+    'Expiry Date': 'datetime64[ns]',
+    'Status': 'category'
+}
+TRANSACTION_DTYPES = {
+    'Transaction ID': 'string',
+    'Product ID': 'string',
+    'Product Name': 'string',
+    'Quantity': 'int32',
+    'Transaction Type': 'category',
+    'Date': 'datetime64[ns]'
+}
+
+# Persistence
+logger = logging.getLogger(__name__)
+
+def load_rows(path):
+    if not os.path.exists(path):
+        return None
+    return pd.read_parquet(path, engine='pyarrow').to_dict('records')
+
+class DebouncedParquetWriter:
+    # Coalesces saves issued within `delay` seconds into one write per file. Frames are
+    # built at flush time on the writer thread, so each write captures the latest rows.
+    def __init__(self, delay=1.0):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._pending = {}
+        self._timer = None
+        atexit.register(self.flush)
+
+    def schedule(self, path, build_frame):
+        with self._lock:
+            self._pending[path] = build_frame
+            if self._timer is None:
+                self._timer = threading.Timer(self.delay, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self):
+        # Flushes run one at a time, so an older snapshot can never be renamed over a newer one
+        with self._write_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                pending, self._pending, self._timer = self._pending, {}, None
+            for path, build_frame in pending.items():
+                try:
+                    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+                    tmp_path = path + '.tmp'
+                    build_frame().to_parquet(tmp_path, engine='pyarrow', compression='zstd', index=False)
+                    os.replace(tmp_path, path)
+                except Exception:
+                    logger.exception("Failed to save %s", path)
+
+class InventoryStore:
+    # Process-wide rows shared by every session; reads and writes hold `lock`
+    def __init__(self):
+        self.lock = threading.RLock()
+        self.writer = DebouncedParquetWriter()
+        
+        # Load saved data when present and seed otherwise
+        inventory_rows = load_rows(INVENTORY_PATH)
+        if inventory_rows is None:
+            inventory_rows = [
+                {'Product ID': 'P001', 'Product Name': 'Laptop', 'Category': 'Electronics', 'Quantity': 50,
+                 'Price': 80000, 'Supplier': 'TechCorp', 'Location': 'Warehouse A', 'Reorder Level': 10,
+                 'Expiry Date': None, 'Status': 'Active'},
+                {'Product ID': 'P002', 'Product Name': 'Mouse', 'Category': 'Accessories', 'Quantity': 200,
+                 'Price': 500, 'Supplier': 'PeriTech', 'Location': 'Warehouse B', 'Reorder Level': 50,
+                 'Expiry Date': None, 'Status': 'Active'},
+                {'Product ID': 'P003', 'Product Name': 'Keyboard', 'Category': 'Accessories', 'Quantity': 150,
+                 'Price': 1200, 'Supplier': 'KeyMaster', 'Location': 'Warehouse A', 'Reorder Level': 30,
+                 'Expiry Date': None, 'Status': 'Active'}
+            ]
+        self.inventory_rows = inventory_rows
+        self.pid_to_idx = {row['Product ID']: idx for idx, row in enumerate(inventory_rows)}
+        
+        transactions_rows = load_rows(TRANSACTIONS_PATH)
+        if transactions_rows is None:
+            transactions_rows = [
+                {'Transaction ID': 'T001', 'Product ID': 'P001', 'Product Name': 'Laptop', 'Quantity': 5,
+                 'Transaction Type': 'Sale', 'Date': datetime.now() - timedelta(days=1)},
+                {'Transaction ID': 'T002', 'Product ID': 'P002', 'Product Name': 'Mouse', 'Quantity': 10,
+                 'Transaction Type': 'Purchase', 'Date': datetime.now()}
+            ]
+        self.transactions_rows = transactions_rows
+        
+        # st.cache_data is shared by all sessions, so versions are unique tokens, not counters
+        self.inventory_version = uuid.uuid4().hex
+        self.transactions_version = uuid.uuid4().hex
+
+    def inventory_frame(self):
+        with self.lock:
+            version = self.inventory_version
+            df = pd.DataFrame.from_records(self.inventory_rows, columns=INVENTORY_COLUMNS)
+        return version, df.astype(INVENTORY_DTYPES)
+
+    def transactions_frame(self):
+        with self.lock:
+            version = self.transactions_version
+            df = pd.DataFrame.from_records(self.transactions_rows, columns=TRANSACTION_COLUMNS)
+        return version, df.astype(TRANSACTION_DTYPES)
+
+    # Mutators call these with `lock` held; the frame is rebuilt by the writer thread
+    def mark_inventory_changed(self):
+        self.inventory_version = uuid.uuid4().hex
+        self.writer.schedule(INVENTORY_PATH, lambda: self.inventory_frame()[1])
+
+    def mark_transactions_changed(self):
+        self.transactions_version = uuid.uuid4().hex
+        self.writer.schedule(TRANSACTIONS_PATH, lambda: self.transactions_frame()[1])
+
+@st.cache_resource
+def get_store():
+    return InventoryStore()
+
+# Row buffers are the source of truth; each session rebuilds its DataFrame lazily
+# once the store's version moves past the one it last built
+def get_inventory_df():
+    store = get_store()
+    if st.session_state.get('inventory_version') != store.inventory_version:
+        st.session_state.inventory_version, st.session_state._inventory_df_cache = store.inventory_frame()
+    return st.session_state._inventory_df_cache
+
+def get_transactions_df():
+    store = get_store()
+    if st.session_state.get('transactions_version') != store.transactions_version:
+        st.session_state.transactions_version, st.session_state._transactions_df_cache = \
+            store.transactions_frame()
+    return st.session_state._transactions_df_cache
 
 # Utility functions
 def add_product(product_data):
-    if product_data['Product ID'] in st.session_state.inventory['Product ID'].values:
-        return False, "Product ID already exists"
-    
-    new_row = pd.DataFrame([product_data])
-    st.session_state.inventory = pd.concat([st.session_state.inventory, new_row], ignore_index=True)
-    log_transaction(product_data['Product ID'], product_data['Product Name'], 
-                   product_data['Quantity'], 'Purchase')
+    store = get_store()
+    with store.lock:
+        if product_data['Product ID'] in store.pid_to_idx:
+            return False, "Product ID already exists"
+        
+        store.pid_to_idx[product_data['Product ID']] = len(store.inventory_rows)
+        store.inventory_rows.append(product_data)
+        store.mark_inventory_changed()
+        log_transaction(product_data['Product ID'], product_data['Product Name'], 
+                       product_data['Quantity'], 'Purchase')
     return True, "Product added successfully"
 
 def update_product(product_id, updates):
-    idx = st.session_state.inventory[st.session_state.inventory['Product ID'] == product_id].index[0]
-    for key, value in updates.items():
-        st.session_state.inventory.at[idx, key] = value
+    store = get_store()
+    with store.lock:
+        if product_id not in store.pid_to_idx:
+            return "Product not found"
+        store.inventory_rows[store.pid_to_idx[product_id]].update(updates)
+        store.mark_inventory_changed()
     return "Product updated successfully"
 
 def delete_product(product_id):
-    st.session_state.inventory = st.session_state.inventory[
-        st.session_state.inventory['Product ID'] != product_id
-    ].reset_index(drop=True)
+    store = get_store()
+    with store.lock:
+        # Swap the row with the last one and pop so no other index shifts
+        rows = store.inventory_rows
+        pid_to_idx = store.pid_to_idx
+        if product_id not in pid_to_idx:
+            return "Product not found"
+        idx = pid_to_idx.pop(product_id)
+        last = rows.pop()
+        if idx < len(rows):
+            rows[idx] = last
+            pid_to_idx[last['Product ID']] = idx
+        store.mark_inventory_changed()
     return "Product deleted successfully"
 
 def log_transaction(product_id, product_name, quantity, trans_type):
-    new_trans = pd.DataFrame([{
-        'Transaction ID': f"T{len(st.session_state.transactions) + 1:03d}",
-        'Product ID': product_id,
-        'Product Name': product_name,
-        'Quantity': quantity,
-        'Transaction Type': trans_type,
-        'Date': datetime.now()
-    }])
-    st.session_state.transactions = pd.concat([st.session_state.transactions, new_trans], ignore_index=True)
-
-def export_to_csv(df, filename):
-    csv = df.to_csv(index=False)
-    b64 = base64.b64encode(csv.encode()).decode()
-    href = f'<a href="data:file/csv;base64,{b64}" download="{filename}.csv">Download {filename}</a>'
-    return href
+    store = get_store()
+    with store.lock:
+        store.transactions_rows.append({
+            'Transaction ID': f"T{len(store.transactions_rows) + 1:03d}",
+            'Product ID': product_id,
+            'Product Name': product_name,
+            'Quantity': quantity,
+            'Transaction Type': trans_type,
+            'Date': datetime.now()
+        })
+        store.mark_transactions_changed()
+
+def to_csv_bytes(df):
+    buf = BytesIO()
+    df.to_csv(buf, index=False)
+    return buf.getvalue()
+
+# Cached aggregates
+@st.cache_resource
+def get_low_stock_kernel():
+    # Compiled once per process; returns None when numba isn't installed
+    if numba is None:
+        return None
+
+    @numba.njit(parallel=True)
+    def low_stock_indices(qty, reorder):
+        # Two passes over per-thread chunks: count matches, then fill at prefix-sum offsets
+        n = len(qty)
+        n_chunks = numba.get_num_threads()
+        chunk = (n + n_chunks - 1) // n_chunks
+        counts = np.zeros(n_chunks + 1, dtype=np.int64)
+        for c in numba.prange(n_chunks):
+            cnt = 0
+            for i in range(c * chunk, min((c + 1) * chunk, n)):
+                if qty[i] <= reorder[i]:
+                    cnt += 1
+            counts[c + 1] = cnt
+        offsets = np.cumsum(counts)
+        out = np.empty(offsets[-1], dtype=np.int64)
+        for c in numba.prange(n_chunks):
+            pos = offsets[c]
+            for i in range(c * chunk, min((c + 1) * chunk, n)):
+                if qty[i] <= reorder[i]:
+                    out[pos] = i
+                    pos += 1
+        return out
+
+    # Streamlit runs each session on its own thread, and numba's fallback workqueue
+    # threading layer aborts the process if two parallel kernels run at once
+    kernel_lock = threading.Lock()
+
+    def run_low_stock_indices(qty, reorder):
+        with kernel_lock:
+            return low_stock_indices(qty, reorder)
+
+    return run_low_stock_indices
+
+# The frame is passed unhashed (leading underscore); `version` alone keys the cache
+@st.cache_data(ttl=300, max_entries=8)
+def low_stock_view(_df, version):
+    qty = _df['Quantity'].to_numpy()
+    reorder = _df['Reorder Level'].to_numpy()
+    kernel = get_low_stock_kernel() if len(_df) >= NUMBA_MIN_ROWS else None
+    if kernel is not None:
+        return _df.iloc[kernel(qty, reorder)]
+    return _df.loc[qty <= reorder]
+
+@st.cache_data(ttl=300, max_entries=8)
+def compute_dashboard_metrics(_df, version):
+    # Single pass with a float64 accumulator and no temporary product array
+    total_value = float(np.einsum('i,i->', _df['Quantity'].to_numpy(), _df['Price'].to_numpy(),
+                                  dtype=np.float64))
+    return len(_df), _df['Quantity'].sum(), total_value
+
+@st.cache_data(ttl=300, max_entries=8)
+def build_category_pie(_df, version):
+    cat_totals = _df.groupby('Category', observed=True)['Quantity'].sum()
+    fig = go.Figure(go.Pie(labels=cat_totals.index.to_numpy(), values=cat_totals.to_numpy()))
+    fig.update_layout(title='Inventory by Category')
+    return fig
+
+@st.cache_data(ttl=300, max_entries=8)
+def build_top10_bar(_df, version):
+    # Partition for the top 10 in O(n), then sort only those 10
+    qty = _df['Quantity'].to_numpy()
+    k = min(10, len(qty))
+    top_idx = np.argpartition(-qty, k - 1)[:k] if k else np.empty(0, dtype=np.intp)
+    top_idx = top_idx[np.argsort(-qty[top_idx], kind='stable')]
+    top10 = _df.iloc[top_idx]
+    fig = go.Figure(go.Bar(x=top10['Product Name'].to_numpy(), y=top10['Quantity'].to_numpy()))
+    fig.update_layout(title='Top 10 Products by Quantity', xaxis_title='Product Name', yaxis_title='Quantity')
+    return fig
 
 # Dashboard
 def show_dashboard():
     st.title("📊 Inventory Management System")
     
+    inventory = get_inventory_df()
+    version = st.session_state.inventory_version
+    total_products, total_qty, total_value = compute_dashboard_metrics(inventory, version)
+    low_stock_items = low_stock_view(inventory, version)
+    
     col1, col2, col3, col4 = st.columns(4)
     with col1:
-        st.metric("Total Products", len(st.session_state.inventory))
+        st.metric("Total Products", total_products)
     with col2:
-        total_qty = st.session_state.inventory['Quantity'].sum()
         st.metric("Total Quantity", total_qty)
     with col3:
-        low_stock = len(st.session_state.inventory[
-            st.session_state.inventory['Quantity'] <= st.session_state.inventory['Reorder Level']
-        ])
-        st.metric("Low Stock Items", low_stock)
+        st.metric("Low Stock Items", len(low_stock_items))
     with col4:
-        total_value = (st.session_state.inventory['Quantity'] * st.session_state.inventory['Price']).sum()
         st.metric("Total Value", f"₹{total_value:,.2f}")
     
     # Charts
     col1, col2 = st.columns(2)
     
     with col1:
-        fig1 = px.pie(st.session_state.inventory, values='Quantity', names='Category',
-                     title='Inventory by Category')
-        st.plotly_chart(fig1, use_container_width=True)
+        st.plotly_chart(build_category_pie(inventory, version), use_container_width=True)
     
     with col2:
-        fig2 = px.bar(st.session_state.inventory.nlargest(10, 'Quantity'),
-                     x='Product Name', y='Quantity', title='Top 10 Products by Quantity')
-        st.plotly_chart(fig2, use_container_width=True)
+        st.plotly_chart(build_top10_bar(inventory, version), use_container_width=True)
     
     # Low stock alert
-    low_stock_items = st.session_state.inventory[
-        st.session_state.inventory['Quantity'] <= st.session_state.inventory['Reorder Level']
-    ]
     if not low_stock_items.empty:
         st.warning("⚠️ Low Stock Alert")
         st.dataframe(low_stock_items[['Product Name', 'Quantity', 'Reorder Level']])
@@ -124,13 +352,13 @@ def manage_products():
             with col1:
                 product_id = st.text_input("Product ID")
                 product_name = st.text_input("Product Name")
-                category = st.selectbox("Category", ["Electronics", "Accessories", "Furniture", "Stationery", "Other"])
-                quantity = st.number_input("Quantity", min_value=0, value=0)
+                category = st.selectbox("Category", CATEGORIES)
+                quantity = st.number_input("Quantity", min_value=0, max_value=MAX_QUANTITY, value=0)
             with col2:
                 price = st.number_input("Price", min_value=0.0, value=0.0)
                 supplier = st.text_input("Supplier")
-                location = st.selectbox("Location", ["Warehouse A", "Warehouse B", "Store Front"])
-                reorder_level = st.number_input("Reorder Level", min_value=0, value=10)
+                location = st.selectbox("Location", LOCATIONS)
+                reorder_level = st.number_input("Reorder Level", min_value=0, max_value=MAX_REORDER_LEVEL, value=10)
             
             submitted = st.form_submit_button("Add Product")
             if submitted:
@@ -154,24 +382,27 @@ def manage_products():
     
     with tab2:
         st.subheader("Edit Product")
-        product_id = st.selectbox("Select Product to Edit", st.session_state.inventory['Product ID'].tolist())
+        product_id = st.selectbox("Select Product to Edit", get_inventory_df()['Product ID'].tolist())
         if product_id:
-            product = st.session_state.inventory[st.session_state.inventory['Product ID'] == product_id].iloc[0]
+            inventory = get_inventory_df()
+            product = inventory[inventory['Product ID'] == product_id].iloc[0]
             with st.form("edit_product_form"):
                 col1, col2 = st.columns(2)
                 with col1:
                     new_name = st.text_input("Product Name", value=product['Product Name'])
                     new_category = st.selectbox("Category", 
-                                              ["Electronics", "Accessories", "Furniture", "Stationery", "Other"],
-                                              index=["Electronics", "Accessories", "Furniture", "Stationery", "Other"].index(product['Category']))
-                    new_quantity = st.number_input("Quantity", min_value=0, value=int(product['Quantity']))
+                                              CATEGORIES,
+                                              index=CATEGORIES.index(product['Category']))
+                    new_quantity = st.number_input("Quantity", min_value=0, max_value=MAX_QUANTITY,
+                                                   value=int(product['Quantity']))
                 with col2:
                     new_price = st.number_input("Price", min_value=0.0, value=float(product['Price']))
                     new_supplier = st.text_input("Supplier", value=product['Supplier'])
                     new_location = st.selectbox("Location", 
-                                               ["Warehouse A", "Warehouse B", "Store Front"],
-                                               index=["Warehouse A", "Warehouse B", "Store Front"].index(product['Location']))
-                    new_reorder = st.number_input("Reorder Level", min_value=0, value=int(product['Reorder Level']))
+                                               LOCATIONS,
+                                               index=LOCATIONS.index(product['Location']))
+                    new_reorder = st.number_input("Reorder Level", min_value=0, max_value=MAX_REORDER_LEVEL,
+                                                  value=int(product['Reorder Level']))
                 
                 update_btn = st.form_submit_button("Update Product")
                 if update_btn:
@@ -189,7 +420,7 @@ def manage_products():
     
     with tab3:
         st.subheader("Delete Product")
-        del_product_id = st.selectbox("Select Product to Delete", st.session_state.inventory['Product ID'].tolist(), key="del_product")
+        del_product_id = st.selectbox("Select Product to Delete", get_inventory_df()['Product ID'].tolist(), key="del_product")
         if st.button("Delete Product"):
             message = delete_product(del_product_id)
             st.success(message)
@@ -197,29 +428,35 @@ def manage_products():
 # Inventory View
 def view_inventory():
     st.title("📋 Inventory View")
-    
+    inventory_table()
+
+# Filter and search widgets rerun only this fragment, not the whole app
+@st.fragment
+def inventory_table():
     # Filters
     col1, col2, col3 = st.columns(3)
     with col1:
-        category_filter = st.multiselect("Category", st.session_state.inventory['Category'].unique())
+        category_filter = st.multiselect("Category", get_inventory_df()['Category'].unique())
     with col2:
-        location_filter = st.multiselect("Location", st.session_state.inventory['Location'].unique())
+        location_filter = st.multiselect("Location", get_inventory_df()['Location'].unique())
     with col3:
-        status_filter = st.multiselect("Status", st.session_state.inventory['Status'].unique(), default=['Active'])
+        status_filter = st.multiselect("Status", get_inventory_df()['Status'].unique(), default=['Active'])
+    
+    # Search
+    search_term = st.text_input("Search products")
     
-    # Apply filters
-    filtered_df = st.session_state.inventory.copy()
+    # Apply filters as a single combined mask so the frame is sliced only once
+    inventory = get_inventory_df()
+    mask = np.ones(len(inventory), dtype=bool)
     if category_filter:
-        filtered_df = filtered_df[filtered_df['Category'].isin(category_filter)]
+        mask &= inventory['Category'].isin(category_filter).to_numpy()
     if location_filter:
-        filtered_df = filtered_df[filtered_df['Location'].isin(location_filter)]
+        mask &= inventory['Location'].isin(location_filter).to_numpy()
     if status_filter:
-        filtered_df = filtered_df[filtered_df['Status'].isin(status_filter)]
-    
-    # Search
-    search_term = st.text_input("Search products")
+        mask &= inventory['Status'].isin(status_filter).to_numpy()
     if search_term:
-        filtered_df = filtered_df[filtered_df['Product Name'].str.contains(search_term, case=False)]
+        mask &= inventory['Product Name'].str.contains(search_term, case=False, regex=False).to_numpy(dtype=bool, na_value=False)
+    filtered_df = inventory[mask]
     
     # Display and edit inventory
     st.data_editor(
@@ -232,14 +469,20 @@ def view_inventory():
     # Export options
     col1, col2 = st.columns(2)
     with col1:
-        st.markdown(export_to_csv(filtered_df, "inventory_export"), unsafe_allow_html=True)
+        st.download_button("Download inventory_export", to_csv_bytes(filtered_df),
+                           file_name="inventory_export.csv", mime="text/csv")
     with col2:
-        st.markdown(export_to_csv(st.session_state.transactions, "transactions_export"), unsafe_allow_html=True)
+        st.download_button("Download transactions_export", to_csv_bytes(get_transactions_df()),
+                           file_name="transactions_export.csv", mime="text/csv")
 
 # Reports
 def show_reports():
     st.title("📈 Reports & Analytics")
-    
+    report_view()
+
+# Switching report type reruns only this fragment, not the whole app
+@st.fragment
+def report_view():
     report_type = st.selectbox("Select Report Type", [
         "Inventory Summary", "Transaction History", "Low Stock Report", 
         "Category Analysis", "Supplier Analysis"
@@ -247,51 +490,58 @@ def show_reports():
     
     if report_type == "Inventory Summary":
         st.subheader("Inventory Summary")
-        summary = st.session_state.inventory.groupby('Category').agg({
+        summary = get_inventory_df().groupby('Category', observed=True).agg({
             'Quantity': 'sum',
             'Price': 'mean'
         }).round(2)
         st.dataframe(summary)
         
-        fig = px.bar(summary, y='Quantity', title='Quantity by Category')
+        fig = go.Figure(go.Bar(x=summary.index.to_numpy(), y=summary['Quantity'].to_numpy()))
+        fig.update_layout(title='Quantity by Category', xaxis_title='Category', yaxis_title='Quantity')
         st.plotly_chart(fig)
     
     elif report_type == "Transaction History":
         st.subheader("Transaction History")
-        st.dataframe(st.session_state.transactions.sort_values('Date', ascending=False))
+        transactions = get_transactions_df()
+        st.dataframe(transactions.sort_values('Date', ascending=False))
         
-        fig = px.line(st.session_state.transactions.groupby('Date').size().reset_index(name='Count'),
-                     x='Date', y='Count', title='Transactions Over Time')
+        # Bucket by day; raw timestamps would give every transaction its own point
+        daily_counts = transactions.set_index('Date').resample('1D').size()
+        fig = go.Figure(go.Scatter(x=daily_counts.index, y=daily_counts.to_numpy(), mode='lines'))
+        fig.update_layout(title='Transactions Over Time', xaxis_title='Date', yaxis_title='Count')
         st.plotly_chart(fig)
     
     elif report_type == "Low Stock Report":
         st.subheader("Low Stock Items")
-        low_stock = st.session_state.inventory[
-            st.session_state.inventory['Quantity'] <= st.session_state.inventory['Reorder Level']
-        ]
+        low_stock = low_stock_view(get_inventory_df(), st.session_state.inventory_version)
         st.dataframe(low_stock)
         
         if not low_stock.empty:
-            fig = px.bar(low_stock, x='Product Name', y='Quantity',
-                        color='Reorder Level', title='Low Stock Items')
+            fig = go.Figure(go.Bar(
+                x=low_stock['Product Name'].to_numpy(), y=low_stock['Quantity'].to_numpy(),
+                marker=dict(color=low_stock['Reorder Level'].to_numpy(), showscale=True,
+                            colorbar=dict(title='Reorder Level'))
+            ))
+            fig.update_layout(title='Low Stock Items', xaxis_title='Product Name', yaxis_title='Quantity')
             st.plotly_chart(fig)
     
     elif report_type == "Category Analysis":
         st.subheader("Category Analysis")
-        category_analysis = st.session_state.inventory.groupby('Category').agg({
+        category_analysis = get_inventory_df().groupby('Category', observed=True).agg({
             'Quantity': 'sum',
             'Price': 'mean',
             'Product ID': 'count'
         }).rename(columns={'Product ID': 'Product Count'})
         st.dataframe(category_analysis)
         
-        fig = px.pie(category_analysis, values='Quantity', names=category_analysis.index,
-                    title='Inventory Distribution by Category')
+        fig = go.Figure(go.Pie(labels=category_analysis.index.to_numpy(),
+                               values=category_analysis['Quantity'].to_numpy()))
+        fig.update_layout(title='Inventory Distribution by Category')
         st.plotly_chart(fig)
     
     elif report_type == "Supplier Analysis":
         st.subheader("Supplier Analysis")
-        supplier_analysis = st.session_state.inventory.groupby('Supplier').agg({
+        supplier_analysis = get_inventory_df().groupby('Supplier', observed=True).agg({
             'Quantity': 'sum',
             'Price': 'mean',
             'Product ID': 'count'